@@ -1,6 +1,6 @@
 import subprocess
-import boto3
 import os
+from functools import lru_cache
 
 BUCKET_NAME = "archmanage"
 REGION = "us-east-1"
@@ -8,26 +8,35 @@ STACK_NAME = "archmanage"
 #LAYER_NAME = "YouTubeAudioDependencies"
 #LAYER_PACKAGE_NAME = "layer.zip"
 
-s3_client = boto3.client("s3", region_name=REGION)
-lambda_client = boto3.client("lambda", region_name=REGION)
+# Clients are built on first use so importing this module needs no AWS setup
+@lru_cache(maxsize=None)
+def _s3():
+    import boto3
+    return boto3.client("s3", region_name=REGION)
+
+
+@lru_cache(maxsize=None)
+def _lambda():
+    import boto3
+    return boto3.client("lambda", region_name=REGION)
 
 
 def bucket_exists(bucket_name):
     try:
-        s3_client.head_bucket(Bucket=bucket_name)
+        _s3().head_bucket(Bucket=bucket_name)
         return True
     except:
         return False
 
 
 def create_bucket(bucket_name, region):
-    s3_client.create_bucket(
+    _s3().create_bucket(
         Bucket=bucket_name,
     )
 
 '''
 def layer_exists(layer_name):
-    layers = lambda_client.list_layers()
+    layers = _lambda().list_layers()
     for layer in layers.get("Layers", []):
         if layer_name == layer["LayerName"]:
             return True
@@ -42,13 +51,13 @@ def prepare_and_upload_layer(bucket_name):
     os.system(f"zip -r {LAYER_PACKAGE_NAME} python/")
     os.system(f"rm -rf python/")
 
-    s3_client.upload_file(LAYER_PACKAGE_NAME, bucket_name, LAYER_PACKAGE_NAME)
+    _s3().upload_file(LAYER_PACKAGE_NAME, bucket_name, LAYER_PACKAGE_NAME)
 
     os.remove(LAYER_PACKAGE_NAME)
     return f"s3://{bucket_name}/{LAYER_PACKAGE_NAME}"
 
 def create_layer(s3_uri, layer_name):
-    lambda_client.publish_layer_version(
+    _lambda().publish_layer_version(
         LayerName=layer_name,
         Description="OpenAI Layer",
         Content={"S3Bucket": BUCKET_NAME, "S3Key": LAYER_PACKAGE_NAME},
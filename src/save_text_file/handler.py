@@ -1,15 +1,50 @@
+import io
 import json
+import logging
 import boto3
 import os
+import uuid
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from datetime import datetime
 
-# Initialize S3 client
-s3_client = boto3.client('s3')
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Initialize S3 client once per container; reused across invocations and threads.
+# The pool matches the transfer manager's max_concurrency below, and retries
+# and timeouts stay within API Gateway's 29 s integration timeout.
+s3_config = Config(
+    max_pool_connections=10,
+    connect_timeout=3,
+    read_timeout=5,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+s3_client = boto3.client('s3', config=s3_config)
 bucket_name = os.environ['S3_BUCKET_NAME']
 
+# Large bodies are split into parts uploaded in parallel
+transfer_config = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Shared by every response; copy before adding per-response headers
+BASE_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Credentials": True,
+    "Access-Control-Allow-Methods": "OPTIONS,POST",
+    "Access-Control-Allow-Headers": "Content-Type,api-token",
+}
+
+# CORS preflight needs no per-request work
+OPTIONS_RESPONSE = {"statusCode": 200, "body": None, "headers": BASE_HEADERS}
+
 def save_file(event, context):
     if event.get("httpMethod") == "OPTIONS":
-        return build_response(200)
+        return OPTIONS_RESPONSE
 
     # Parse the incoming JSON event
     body = json.loads(event['body'])
@@ -23,28 +58,28 @@ def save_file(event, context):
 
     # Save the content to S3 as a .txt file
     try:
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=file_name,
-            Body=file_content,
-            ContentType='text/plain'
+        if isinstance(file_content, str):
+            file_content = file_content.encode('utf-8')
+        s3_client.upload_fileobj(
+            io.BytesIO(file_content),
+            bucket_name,
+            file_name,
+            ExtraArgs={'ContentType': 'text/plain'},
+            Config=transfer_config
         )
         return build_response(200, {'message': f'File {file_name} saved successfully'})
-    except Exception as e:
-        return build_response(500, {'error': str(e)})
+    except Exception:
+        # Full traceback goes to CloudWatch; the client only gets an id to quote
+        err_id = uuid.uuid4().hex
+        logger.exception('error %s saving %s', err_id, file_name)
+        return build_response(500, {'error': 'internal', 'err_id': err_id})
 
 def build_response(status_code, body=None, binary=False):
-    headers = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Credentials": True,
-        "Access-Control-Allow-Methods": "OPTIONS,POST",
-        "Access-Control-Allow-Headers": "Content-Type,api-token",
-    }
+    headers = BASE_HEADERS
 
     if not binary and body is not None:
         body = json.dumps(body)
     elif binary:
-        headers["Content-Type"] = "audio/mp3"
-        body = body
+        headers = {**BASE_HEADERS, "Content-Type": "audio/mp3"}
 
     return {"statusCode": status_code, "body": body, "headers": headers}